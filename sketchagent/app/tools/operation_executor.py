@@ -10,33 +10,31 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_VALID_OPERATION_TYPES = frozenset(
+    {"move", "resize", "add", "delete", "modify", "align", "distribute", "replace"}
+)
+_SINGLE_TARGET_OPERATION_TYPES = frozenset({"move", "resize", "delete", "modify"})
+_MULTI_TARGET_OPERATION_TYPES = frozenset({"align", "distribute"})
+
 
 def validate_operations(
     current_sketch: list[PlacedComponent],
     operations: list[ComponentOperation],
 ) -> tuple[bool, Optional[str]]:
     """Validate operations before execution"""
+    existing_ids = {comp.id for comp in current_sketch}
     for i, operation in enumerate(operations):
         # Validate operation type
-        if operation.type not in [
-            "move",
-            "resize",
-            "add",
-            "delete",
-            "modify",
-            "align",
-            "distribute",
-            "replace",
-        ]:
+        if operation.type not in _VALID_OPERATION_TYPES:
             return False, f"Operation {i}: Invalid operation type '{operation.type}'"
 
         # Validate based on operation type
-        if operation.type in ["move", "resize", "delete", "modify"]:
+        if operation.type in _SINGLE_TARGET_OPERATION_TYPES:
             if not operation.componentId:
                 return False, f"Operation {i}: Missing componentId for {operation.type}"
             # Check if component exists
             if operation.type != "add":
-                if not any(comp.id == operation.componentId for comp in current_sketch):
+                if operation.componentId not in existing_ids:
                     return False, f"Operation {i}: Component {operation.componentId} not found"
 
         if operation.type == "move":
@@ -59,12 +57,12 @@ def validate_operations(
             if operation.width is None or operation.height is None:
                 return False, f"Operation {i}: Missing width or height for add operation"
 
-        if operation.type in ["align", "distribute"]:
+        if operation.type in _MULTI_TARGET_OPERATION_TYPES:
             if not operation.targetIds or len(operation.targetIds) < 2:
                 return False, f"Operation {i}: Need at least 2 targetIds for {operation.type}"
             # Check if all target components exist
             for target_id in operation.targetIds:
-                if not any(comp.id == target_id for comp in current_sketch):
+                if target_id not in existing_ids:
                     return False, f"Operation {i}: Target component {target_id} not found"
 
         if operation.type == "align":
@@ -100,7 +98,8 @@ def execute_operations(
     if not is_valid:
         raise ValidationError(f"Operation validation failed: {error_msg}")
 
-    sketch = [PlacedComponent(**comp.model_dump()) for comp in current_sketch]
+    # Executors never mutate components in place, so a shallow copy of the list is enough
+    sketch = list(current_sketch)
 
     try:
         for operation in operations:
@@ -158,22 +157,22 @@ def _execute_resize(
     min_width = 20.0
     min_height = 20.0
 
-    result = []
-    for comp in sketch:
-        if comp.id == operation.componentId:
-            width = max(min_width, operation.width)
-            height = (
-                max(2.0, operation.height)
-                if comp.type == ComponentType.HORIZONTAL_LINE
-                else max(min_height, operation.height)
-            )
-            result.append(
-                PlacedComponent(**{**comp.model_dump(), "width": width, "height": height})
-            )
-        else:
-            result.append(comp)
-
-    return result
+    return [
+        PlacedComponent(
+            **{
+                **comp.model_dump(),
+                "width": max(min_width, operation.width),
+                "height": (
+                    max(2.0, operation.height)
+                    if comp.type == ComponentType.HORIZONTAL_LINE
+                    else max(min_height, operation.height)
+                ),
+            }
+        )
+        if comp.id == operation.componentId
+        else comp
+        for comp in sketch
+    ]
 
 
 def _execute_add(
@@ -236,15 +235,12 @@ def _execute_modify(
     if not operation.componentId or not operation.props:
         return sketch
 
-    result = []
-    for comp in sketch:
-        if comp.id == operation.componentId:
-            updated_props = {**comp.props, **operation.props}
-            result.append(PlacedComponent(**{**comp.model_dump(), "props": updated_props}))
-        else:
-            result.append(comp)
-
-    return result
+    return [
+        PlacedComponent(**{**comp.model_dump(), "props": {**comp.props, **operation.props}})
+        if comp.id == operation.componentId
+        else comp
+        for comp in sketch
+    ]
 
 
 def _execute_align(
@@ -258,65 +254,61 @@ def _execute_align(
     ):
         return sketch
 
-    target_components = [comp for comp in sketch if comp.id in operation.targetIds]
+    target_ids = set(operation.targetIds)
+    target_components = [comp for comp in sketch if comp.id in target_ids]
     if len(target_components) < 2:
         return sketch
 
-    result = []
     aligned_value: float
 
     if operation.alignment == "left":
         aligned_value = min(comp.x for comp in target_components)
-        for comp in sketch:
-            if comp.id in operation.targetIds:
-                result.append(PlacedComponent(**{**comp.model_dump(), "x": aligned_value}))
-            else:
-                result.append(comp)
-
-    elif operation.alignment == "right":
+        return [
+            PlacedComponent(**{**comp.model_dump(), "x": aligned_value})
+            if comp.id in target_ids
+            else comp
+            for comp in sketch
+        ]
+
+    if operation.alignment == "right":
         aligned_value = max(comp.x + comp.width for comp in target_components)
-        for comp in sketch:
-            if comp.id in operation.targetIds:
-                result.append(
-                    PlacedComponent(**{**comp.model_dump(), "x": aligned_value - comp.width})
-                )
-            else:
-                result.append(comp)
-
-    elif operation.alignment == "center":
+        return [
+            PlacedComponent(**{**comp.model_dump(), "x": aligned_value - comp.width})
+            if comp.id in target_ids
+            else comp
+            for comp in sketch
+        ]
+
+    if operation.alignment == "center":
         aligned_value = sum(comp.x + comp.width / 2 for comp in target_components) / len(
             target_components
         )
-        for comp in sketch:
-            if comp.id in operation.targetIds:
-                result.append(
-                    PlacedComponent(**{**comp.model_dump(), "x": aligned_value - comp.width / 2})
-                )
-            else:
-                result.append(comp)
-
-    elif operation.alignment == "top":
+        return [
+            PlacedComponent(**{**comp.model_dump(), "x": aligned_value - comp.width / 2})
+            if comp.id in target_ids
+            else comp
+            for comp in sketch
+        ]
+
+    if operation.alignment == "top":
         aligned_value = min(comp.y for comp in target_components)
-        for comp in sketch:
-            if comp.id in operation.targetIds:
-                result.append(PlacedComponent(**{**comp.model_dump(), "y": aligned_value}))
-            else:
-                result.append(comp)
-
-    elif operation.alignment == "bottom":
+        return [
+            PlacedComponent(**{**comp.model_dump(), "y": aligned_value})
+            if comp.id in target_ids
+            else comp
+            for comp in sketch
+        ]
+
+    if operation.alignment == "bottom":
         aligned_value = max(comp.y + comp.height for comp in target_components)
-        for comp in sketch:
-            if comp.id in operation.targetIds:
-                result.append(
-                    PlacedComponent(**{**comp.model_dump(), "y": aligned_value - comp.height})
-                )
-            else:
-                result.append(comp)
-
-    else:
-        return sketch
+        return [
+            PlacedComponent(**{**comp.model_dump(), "y": aligned_value - comp.height})
+            if comp.id in target_ids
+            else comp
+            for comp in sketch
+        ]
 
-    return result
+    return sketch
 
 
 def _execute_distribute(
@@ -344,14 +336,7 @@ def _execute_distribute(
         updated_components[comp.id] = PlacedComponent(**{**comp.model_dump(), "x": current_x})
         current_x += comp.width + operation.spacing
 
-    result = []
-    for comp in sketch:
-        if comp.id in updated_components:
-            result.append(updated_components[comp.id])
-        else:
-            result.append(comp)
-
-    return result
+    return [updated_components.get(comp.id, comp) for comp in sketch]
 
 
 def _execute_replace(
@@ -1,5 +1,8 @@
 """Sketch layout parser - ported from TypeScript"""
 
+from collections import Counter, defaultdict
+from itertools import combinations
+from statistics import median
 from typing import TypedDict, Optional
 from ..schemas.sketch import PlacedComponent
 
@@ -47,6 +50,17 @@ class LayoutAnalysis(TypedDict):
     layoutStats: LayoutStats
 
 
+# Position labels indexed by [column][row] bucket
+_POSITIONS = (
+    ("left side, top section", "left side, middle section", "left side, bottom section"),
+    ("center, top section", "center, middle section", "center, bottom section"),
+    ("right side, top section", "right side, middle section", "right side, bottom section"),
+)
+
+# Below this size every pair is checked directly; the spatial index only pays off for larger sketches
+_SPATIAL_INDEX_MIN_COMPONENTS = 32
+
+
 def parse_sketch_layout(components: list[PlacedComponent]) -> LayoutAnalysis:
     """Parse and analyze sketch layout"""
     if not components:
@@ -106,19 +120,9 @@ def _describe_component(
     y_percent = ((component.y - bounds["minY"]) / canvas_height * 100) if canvas_height > 0 else 0
 
     # Determine position
-    if component.x < canvas_width * 0.33:
-        position = "left side"
-    elif component.x > canvas_width * 0.66:
-        position = "right side"
-    else:
-        position = "center"
-
-    if component.y < canvas_height * 0.33:
-        position += ", top section"
-    elif component.y > canvas_height * 0.66:
-        position += ", bottom section"
-    else:
-        position += ", middle section"
+    col = 0 if component.x < canvas_width * 0.33 else 2 if component.x > canvas_width * 0.66 else 1
+    row = 0 if component.y < canvas_height * 0.33 else 2 if component.y > canvas_height * 0.66 else 1
+    position = _POSITIONS[col][row]
 
     size = f"{int(component.width)}x{int(component.height)}px"
 
@@ -136,88 +140,108 @@ def _identify_relationships(components: list[PlacedComponent]) -> list[SpatialRe
     relationships: list[SpatialRelationship] = []
     threshold = 20.0  # pixels
 
-    for i in range(len(components)):
-        for j in range(i + 1, len(components)):
-            comp1 = components[i]
-            comp2 = components[j]
+    for i, j in _candidate_pairs(components, threshold):
+        comp1 = components[i]
+        comp2 = components[j]
+
+        # Edge overlaps along each axis (negative when separated)
+        dx = min(comp1.x + comp1.width, comp2.x + comp2.width) - max(comp1.x, comp2.x)
+        dy = min(comp1.y + comp1.height, comp2.y + comp2.height) - max(comp1.y, comp2.y)
+
+        # Check for overlapping (touching edges count as overlapping)
+        if dx >= 0 and dy >= 0:
+            relationships.append({
+                "component1": comp1.id,
+                "component2": comp2.id,
+                "relationship": "overlapping",
+            })
+            continue
 
-            # Check for overlapping
-            if _is_overlapping(comp1, comp2):
+        # Check vertical relationships
+        horizontal_overlap = max(0, dx)
+
+        if horizontal_overlap > min(comp1.width, comp2.width) * 0.5:
+            if comp1.y + comp1.height < comp2.y:
                 relationships.append({
                     "component1": comp1.id,
                     "component2": comp2.id,
-                    "relationship": "overlapping",
+                    "relationship": "above",
+                    "distance": comp2.y - (comp1.y + comp1.height),
                 })
-                continue
-
-            # Check vertical relationships
-            vertical_distance = abs(
-                (comp1.y + comp1.height / 2) - (comp2.y + comp2.height / 2)
-            )
-            horizontal_overlap = max(
-                0,
-                min(comp1.x + comp1.width, comp2.x + comp2.width)
-                - max(comp1.x, comp2.x),
-            )
-
-            if horizontal_overlap > min(comp1.width, comp2.width) * 0.5:
-                if comp1.y + comp1.height < comp2.y:
-                    relationships.append({
-                        "component1": comp1.id,
-                        "component2": comp2.id,
-                        "relationship": "above",
-                        "distance": comp2.y - (comp1.y + comp1.height),
-                    })
-                elif comp2.y + comp2.height < comp1.y:
-                    relationships.append({
-                        "component1": comp1.id,
-                        "component2": comp2.id,
-                        "relationship": "below",
-                        "distance": comp1.y - (comp2.y + comp2.height),
-                    })
-
-            # Check horizontal relationships
-            vertical_overlap = max(
-                0,
-                min(comp1.y + comp1.height, comp2.y + comp2.height)
-                - max(comp1.y, comp2.y),
-            )
-
-            if vertical_overlap > min(comp1.height, comp2.height) * 0.5:
-                if comp1.x + comp1.width < comp2.x:
-                    relationships.append({
-                        "component1": comp1.id,
-                        "component2": comp2.id,
-                        "relationship": "left",
-                        "distance": comp2.x - (comp1.x + comp1.width),
-                    })
-                elif comp2.x + comp2.width < comp1.x:
-                    relationships.append({
-                        "component1": comp1.id,
-                        "component2": comp2.id,
-                        "relationship": "right",
-                        "distance": comp1.x - (comp2.x + comp2.width),
-                    })
-
-            # Check alignment
-            if abs(comp1.x - comp2.x) < threshold:
+            elif comp2.y + comp2.height < comp1.y:
                 relationships.append({
                     "component1": comp1.id,
                     "component2": comp2.id,
-                    "relationship": "aligned",
+                    "relationship": "below",
+                    "distance": comp1.y - (comp2.y + comp2.height),
                 })
 
+        # Check horizontal relationships
+        vertical_overlap = max(0, dy)
+
+        if vertical_overlap > min(comp1.height, comp2.height) * 0.5:
+            if comp1.x + comp1.width < comp2.x:
+                relationships.append({
+                    "component1": comp1.id,
+                    "component2": comp2.id,
+                    "relationship": "left",
+                    "distance": comp2.x - (comp1.x + comp1.width),
+                })
+            elif comp2.x + comp2.width < comp1.x:
+                relationships.append({
+                    "component1": comp1.id,
+                    "component2": comp2.id,
+                    "relationship": "right",
+                    "distance": comp1.x - (comp2.x + comp2.width),
+                })
+
+        # Check alignment
+        if abs(comp1.x - comp2.x) < threshold:
+            relationships.append({
+                "component1": comp1.id,
+                "component2": comp2.id,
+                "relationship": "aligned",
+            })
+
     return relationships
 
 
-def _is_overlapping(comp1: PlacedComponent, comp2: PlacedComponent) -> bool:
-    """Check if two components overlap"""
-    return not (
-        comp1.x + comp1.width < comp2.x
-        or comp2.x + comp2.width < comp1.x
-        or comp1.y + comp1.height < comp2.y
-        or comp2.y + comp2.height < comp1.y
-    )
+def _candidate_pairs(
+    components: list[PlacedComponent], threshold: float
+) -> list[tuple[int, int]]:
+    """Collect index pairs (i < j) that can share a spatial relationship
+
+    Components are hashed into uniform grid columns and rows by their extent, and into
+    threshold-wide buckets by their left edge. A pair can only relate if it shares a
+    column (horizontal overlap), a row (vertical overlap) or neighbouring alignment
+    buckets, so all other pairs are skipped. Pairs are returned in loop order.
+    """
+    n = len(components)
+    if n < _SPATIAL_INDEX_MIN_COMPONENTS:
+        return list(combinations(range(n), 2))
+
+    cell = max(median(c.width for c in components), median(c.height for c in components))
+    columns: dict[int, list[int]] = defaultdict(list)
+    rows: dict[int, list[int]] = defaultdict(list)
+    left_edges: dict[int, list[int]] = defaultdict(list)
+
+    for i, comp in enumerate(components):
+        for ix in range(int(comp.x // cell), int((comp.x + comp.width) // cell) + 1):
+            columns[ix].append(i)
+        for iy in range(int(comp.y // cell), int((comp.y + comp.height) // cell) + 1):
+            rows[iy].append(i)
+        left_edges[int(comp.x // threshold)].append(i)
+
+    pairs: set[tuple[int, int]] = set()
+    for bucket in (*columns.values(), *rows.values()):
+        pairs.update(combinations(bucket, 2))
+    for key, bucket in left_edges.items():
+        pairs.update(combinations(bucket, 2))
+        neighbors = left_edges.get(key + 1)
+        if neighbors:
+            pairs.update((min(i, j), max(i, j)) for i in bucket for j in neighbors)
+
+    return sorted(pairs)
 
 
 def _analyze_layout(
@@ -226,11 +250,8 @@ def _analyze_layout(
     """Analyze layout structure"""
     canvas_width = bounds["maxX"] - bounds["minX"]
     canvas_height = bounds["maxY"] - bounds["minY"]
-    component_types: dict[str, int] = {}
-
-    for comp in components:
-        comp_type = comp.type.value
-        component_types[comp_type] = component_types.get(comp_type, 0) + 1
+    type_counts = Counter(comp.type for comp in components)
+    component_types = {comp_type.value: count for comp_type, count in type_counts.items()}
 
     # Identify columns
     mid_x = bounds["minX"] + canvas_width / 2
@@ -2,35 +2,48 @@
 
 import time
 from typing import Any, Optional
-from contextlib import contextmanager
-from .logger import get_logger
+from .logger import get_logger, is_debug_enabled
 
 logger = get_logger(__name__)
 
 
-@contextmanager
-def log_node_execution(node_name: str, session_id: Optional[str] = None):
+class log_node_execution:
     """Context manager for logging node execution with timing"""
-    start_time = time.time()
-    logger.debug(
-        "Node execution started",
-        node=node_name,
-        session_id=session_id,
-    )
-    try:
-        yield
-    finally:
-        elapsed = time.time() - start_time
+
+    __slots__ = ("node_name", "session_id", "start_time")
+
+    def __init__(self, node_name: str, session_id: Optional[str] = None):
+        self.node_name = node_name
+        self.session_id = session_id
+        self.start_time: Optional[float] = None
+
+    def __enter__(self) -> "log_node_execution":
+        if is_debug_enabled():
+            self.start_time = time.perf_counter()
+            logger.debug(
+                "Node execution started",
+                node=self.node_name,
+                session_id=self.session_id,
+            )
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.start_time is None:
+            return
+        elapsed = time.perf_counter() - self.start_time
         logger.debug(
             "Node execution completed",
-            node=node_name,
-            session_id=session_id,
+            node=self.node_name,
+            session_id=self.session_id,
             duration_seconds=round(elapsed, 3),
         )
 
 
 def log_state_snapshot(state: dict[str, Any], stage: str, session_id: Optional[str] = None):
     """Log a snapshot of agent state"""
+    if not is_debug_enabled():
+        return {}
+
     snapshot = {
         "stage": stage,
         "step": state.get("step"),
@@ -56,6 +69,9 @@ def log_llm_request(
     has_image: bool = False,
 ):
     """Log LLM request (without sensitive data)"""
+    if not is_debug_enabled():
+        return
+
     logger.debug(
         "LLM request",
         session_id=session_id,
@@ -71,6 +87,9 @@ def log_llm_response(
     has_json: bool = False,
 ):
     """Log LLM response (without content)"""
+    if not is_debug_enabled():
+        return
+
     logger.debug(
         "LLM response received",
         session_id=session_id,
@@ -85,6 +104,9 @@ def log_graph_transition(
     session_id: Optional[str] = None,
 ):
     """Log graph state transition"""
+    if not is_debug_enabled():
+        return
+
     logger.debug(
         "Graph transition",
         session_id=session_id,
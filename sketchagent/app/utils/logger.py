@@ -6,15 +6,21 @@ from typing import Any
 import structlog
 from structlog.types import Processor
 
+# Level given to the structlog filtering logger; NOTSET matches structlog's unconfigured default
+_log_level: int = logging.NOTSET
+
 
 def setup_logging(log_level: str = "INFO", json_output: bool = False) -> None:
     """Configure structured logging"""
+    global _log_level
+    level = getattr(logging, log_level.upper())
+    _log_level = level
 
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
 
     # Configure processors
@@ -34,15 +40,18 @@ def setup_logging(log_level: str = "INFO", json_output: bool = False) -> None:
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def is_debug_enabled() -> bool:
+    """Check whether the level configured by setup_logging lets DEBUG records through"""
+    return _log_level <= logging.DEBUG
+
+
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a structured logger instance"""
     return structlog.get_logger(name)
@@ -1,104 +1,180 @@
 """Pytest configuration and fixtures"""
 
+import itertools
 import pytest
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, MagicMock
-from typing import AsyncGenerator
-from app.services.llm_service import LLMService
+from fastapi.testclient import TestClient
+from app.main import app
+from app.api.routes import set_services
+from app.api.debug_routes import set_debug_services
+from app.agent.graph import create_agent_graph
 from app.services.redis_service import RedisService
 from app.schemas.sketch import PlacedComponent
-from tests.fixtures import create_sample_sketch, create_empty_sketch, create_single_component_sketch
 
+# Rewrite asserts in the shared helpers so failures show pytest's detailed diffs;
+# must run before tests.helpers is first imported
+pytest.register_assert_rewrite("tests.helpers")
+
+from tests.fixtures import (  # noqa: E402
+    create_sample_sketch,
+    create_empty_sketch,
+    create_single_component_sketch,
+    freeze_sketch,
+)
+from tests.helpers import StubLLM, create_agent_state  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def sample_sketch() -> tuple[PlacedComponent, ...]:
+    """Sample sketch fixture, built once per session
+
+    A tuple of frozen components, so tests cannot alter it for later ones.
+    """
+    return freeze_sketch(create_sample_sketch())
+
+
+@pytest.fixture(scope="session")
+def sample_sketch_dump(sample_sketch) -> list[dict]:
+    """Sample sketch serialized for request bodies, dumped once per session
+
+    Request bodies are only serialized by the client, never mutated.
+    """
+    return [comp.model_dump() for comp in sample_sketch]
 
-@pytest.fixture
-def sample_sketch() -> list[PlacedComponent]:
-    """Sample sketch fixture"""
-    return create_sample_sketch()
+
+@pytest.fixture(scope="session")
+def _empty_sketch_components() -> tuple[PlacedComponent, ...]:
+    """Empty sketch components, built once per session"""
+    return tuple(create_empty_sketch())
+
+
+@pytest.fixture(scope="session")
+def _single_component_sketch_components() -> tuple[PlacedComponent, ...]:
+    """Single component sketch components, built once per session"""
+    return tuple(create_single_component_sketch())
 
 
 @pytest.fixture
-def empty_sketch() -> list[PlacedComponent]:
+def empty_sketch(_empty_sketch_components) -> list[PlacedComponent]:
     """Empty sketch fixture"""
-    return create_empty_sketch()
+    return [
+        comp.model_copy(update={"props": dict(comp.props)}) for comp in _empty_sketch_components
+    ]
 
 
 @pytest.fixture
-def single_component_sketch() -> list[PlacedComponent]:
+def single_component_sketch(_single_component_sketch_components) -> list[PlacedComponent]:
     """Single component sketch fixture"""
-    return create_single_component_sketch()
+    return [
+        comp.model_copy(update={"props": dict(comp.props)})
+        for comp in _single_component_sketch_components
+    ]
 
 
-@pytest.fixture
-def mock_llm_service() -> LLMService:
-    """Mock LLM service that returns configurable responses"""
-    service = MagicMock(spec=LLMService)
-    service.invoke = AsyncMock(return_value='{"operations": [], "reasoning": "Test", "description": "Test"}')
-    return service
+DEFAULT_LLM_RESPONSE = '{"operations": [], "reasoning": "Test", "description": "Test"}'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_llm_service() -> StubLLM:
+    """Mock LLM service that returns configurable responses
+
+    Shared across the session; tests set ret/exc and both are restored after each test.
+    """
+    return StubLLM(ret=DEFAULT_LLM_RESPONSE)
+
+
+@pytest.fixture(scope="session")
 def mock_llm_service_with_response() -> callable:
     """Factory for mock LLM service with custom response"""
     def _create_mock(response: str):
-        service = MagicMock(spec=LLMService)
-        service.invoke = AsyncMock(return_value=response)
-        return service
+        return StubLLM(ret=response)
     return _create_mock
 
 
-@pytest.fixture
-async def mock_redis_service() -> AsyncGenerator[RedisService, None]:
+@dataclass(slots=True)
+class _SessionRecord:
+    """Session record held by the mock Redis service"""
+    session_id: str
+    created_at: str
+    updated_at: str
+    initial_sketch: list
+    latest_sketch: list
+    current_sketch: list
+    operation_history: list = field(default_factory=list)
+    message_history: list = field(default_factory=list)
+
+
+@pytest.fixture(scope="session")
+def _mock_redis_state() -> dict[str, dict]:
+    """Backing store for the mock Redis service"""
+    return {"storage": {}}
+
+
+@pytest.fixture(scope="session")
+def mock_redis_service(_mock_redis_state) -> RedisService:
     """Mock Redis service using in-memory storage"""
     service = MagicMock(spec=RedisService)
 
-    # In-memory storage
-    storage: dict[str, dict] = {}
+    # In-memory storage, cleared after each test
+    storage: dict[str, _SessionRecord] = _mock_redis_state["storage"]
+    # Tests never inspect timestamps; a counter keeps them ordered without reading the clock
+    clock = itertools.count()
+
+    def _dump(items: list) -> list:
+        return [item.model_dump() if hasattr(item, "model_dump") else item for item in items]
 
     async def create_session(initial_sketch: list[PlacedComponent], session_id: str = None):
         import uuid
-        from datetime import datetime, UTC
         if not session_id:
             session_id = str(uuid.uuid4())
-        storage[session_id] = {
-            "session_id": session_id,
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat(),
-            "initial_sketch": [comp.model_dump() for comp in initial_sketch],
-            "latest_sketch": [comp.model_dump() for comp in initial_sketch],
-            "current_sketch": [comp.model_dump() for comp in initial_sketch],
-            "operation_history": [],
-            "message_history": [],
-        }
+        timestamp = str(next(clock))
+        # Components are kept as model instances; only get_session serializes them
+        storage[session_id] = _SessionRecord(
+            session_id=session_id,
+            created_at=timestamp,
+            updated_at=timestamp,
+            initial_sketch=list(initial_sketch),
+            latest_sketch=list(initial_sketch),
+            current_sketch=list(initial_sketch),
+        )
         return session_id
 
     async def get_session(session_id: str):
-        return storage.get(session_id)
+        record = storage.get(session_id)
+        if record is None:
+            return None
+        # Match the JSON-decoded shape returned by RedisService.get_session
+        return {
+            "session_id": record.session_id,
+            "created_at": record.created_at,
+            "updated_at": record.updated_at,
+            "initial_sketch": _dump(record.initial_sketch),
+            "latest_sketch": _dump(record.latest_sketch),
+            "current_sketch": _dump(record.current_sketch),
+            "operation_history": _dump(record.operation_history),
+            "message_history": list(record.message_history),
+        }
 
     async def update_session(session_id: str, **kwargs):
-        if session_id in storage:
-            from datetime import datetime, UTC
-            storage[session_id]["updated_at"] = datetime.now(UTC).isoformat()
+        record = storage.get(session_id)
+        if record is not None:
+            record.updated_at = str(next(clock))
             for key, value in kwargs.items():
                 if key == "current_sketch" and value:
-                    storage[session_id]["current_sketch"] = [
-                        comp.model_dump() if hasattr(comp, "model_dump") else comp
-                        for comp in value
-                    ]
+                    record.current_sketch = list(value)
                 elif key == "operations" and value:
-                    storage[session_id]["operation_history"] = [
-                        op.model_dump() if hasattr(op, "model_dump") else op
-                        for op in value
-                    ]
+                    record.operation_history = list(value)
 
     async def delete_session(session_id: str):
         if session_id in storage:
             del storage[session_id]
 
     async def get_latest_sketch(session_id: str):
-        session = storage.get(session_id)
-        if session and session.get("latest_sketch"):
-            return [
-                PlacedComponent(**comp) for comp in session["latest_sketch"]
-            ]
+        record = storage.get(session_id)
+        if record and record.latest_sketch:
+            return list(record.latest_sketch)
         return None
 
     async def extend_session_ttl(session_id: str):
@@ -111,12 +187,61 @@ async def mock_redis_service() -> AsyncGenerator[RedisService, None]:
     service.get_latest_sketch = AsyncMock(side_effect=get_latest_sketch)
     service.extend_session_ttl = AsyncMock(side_effect=extend_session_ttl)
 
-    yield service
+    return service
+
+
+@pytest.fixture(scope="session")
+def agent_graph(mock_llm_service):
+    """Agent graph compiled once per session around the shared mock LLM service
+
+    Tests steer the replies by setting mock_llm_service.ret or mock_llm_service.exc.
+    Its checkpointer is shared too, so each test runs under its own thread_id.
+    """
+    return create_agent_graph(mock_llm_service)
+
+
+@pytest.fixture(scope="session")
+def test_client(mock_llm_service, mock_redis_service):
+    """API test client wired to the shared mock services
+
+    Tests customize responses through mock_llm_service.ret/exc; _reset_mocks
+    restores it, so one client serves the whole session. The client is entered once so
+    the lifespan runs a single time, with the app's Redis/OpenAI startup swapped for one
+    that installs the mocks.
+    """
+    @asynccontextmanager
+    async def _mock_lifespan(_app):
+        set_services(mock_redis_service, mock_llm_service)
+        set_debug_services(mock_redis_service, mock_llm_service)
+        yield
+
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _mock_lifespan
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.router.lifespan_context = original_lifespan
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(request):
+    """Reset the shared mock services after each test that used them
+
+    Tests that never request a mock, directly or through another fixture, skip the reset.
+    """
+    yield
+    if "mock_llm_service" in request.fixturenames:
+        mock_llm_service = request.getfixturevalue("mock_llm_service")
+        mock_llm_service.ret = DEFAULT_LLM_RESPONSE
+        mock_llm_service.exc = None
+    if "mock_redis_service" in request.fixturenames:
+        request.getfixturevalue("mock_redis_service").reset_mock()
+        request.getfixturevalue("_mock_redis_state")["storage"].clear()
 
 
 @pytest.fixture
 def agent_state(sample_sketch):
     """Agent state fixture"""
-    from tests.helpers import create_agent_state
     return create_agent_state(current_sketch=sample_sketch)
 
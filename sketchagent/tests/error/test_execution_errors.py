@@ -37,8 +37,6 @@ class TestExecutionErrors:
 
     def test_execute_invalid_component_reference(self, sample_sketch):
         """Test execution error when component doesn't exist"""
-        from tests.fixtures import create_move_operation
-
         operations = [
             create_move_operation("nonexistent-component", 200, 100),
         ]
@@ -1,9 +1,10 @@
 """Tests for validation error handling"""
 
 import pytest
-from tests.fixtures import create_sample_sketch, create_move_operation
+from tests.fixtures import create_sample_sketch, create_move_operation, create_resize_operation
 from tests.helpers import create_agent_state, assert_state_error
 from app.agent.nodes.validator import validate_node
+from app.schemas.sketch import ComponentOperation
 from app.utils.errors import ValidationError
 
 
@@ -26,7 +27,8 @@ class TestValidationErrors:
         result = validate_node(state)
 
         assert_state_error(result, should_have_error=True)
-        assert "componentId" in result["error"].lower() or "missing" in result["error"].lower()
+        error = result["error"].lower()
+        assert "componentid" in error or "missing" in error
 
     def test_validate_invalid_component_id(self, sample_sketch):
         """Test validation error when component doesn't exist"""
@@ -47,8 +49,6 @@ class TestValidationErrors:
 
     def test_validate_invalid_resize_dimensions(self, sample_sketch):
         """Test validation error for invalid resize dimensions"""
-        from tests.fixtures import create_resize_operation
-
         operations = [
             create_resize_operation("component-1", 10, 10),  # Too small
         ]
@@ -65,9 +65,6 @@ class TestValidationErrors:
 
     def test_validate_missing_coordinates(self, sample_sketch):
         """Test validation error when coordinates are missing"""
-        from tests.fixtures import create_move_operation
-        from app.schemas.sketch import ComponentOperation
-
         operations = [
             ComponentOperation(
                 type="move",
@@ -101,8 +98,6 @@ class TestValidationErrors:
 
     def test_validate_no_current_sketch(self):
         """Test validation error when current sketch is None"""
-        from tests.fixtures import create_move_operation
-
         operations = [create_move_operation("component-1", 200, 100)]
 
         # Create state with explicit None for current_sketch
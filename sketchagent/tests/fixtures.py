@@ -1,37 +1,64 @@
-"""Test data fixtures"""
+"""Test data fixtures
 
+Sketch factories use PlacedComponent.model_construct to skip validation for these
+known-good literals; test_sketch_fixtures.py checks that they still validate.
+freeze_sketch gives session-scoped fixtures components that raise on assignment.
+"""
+
+from pydantic import ConfigDict
 from app.schemas.sketch import PlacedComponent, ComponentType, ComponentOperation
 
+# Shared by every fixture component (model_construct stores it as-is); never mutate it
+_EMPTY_PROPS: dict = {}
+
+
+class FrozenPlacedComponent(PlacedComponent):
+    """PlacedComponent that rejects attribute assignment"""
+
+    model_config = ConfigDict(frozen=True)
+
+
+def freeze_sketch(sketch: list[PlacedComponent]) -> tuple[PlacedComponent, ...]:
+    """Read-only copy of a sketch for fixtures shared across tests
+
+    Each component gets its own props copy, so the shared _EMPTY_PROPS cannot be
+    changed through a frozen component.
+    """
+    return tuple(
+        FrozenPlacedComponent.model_construct(**{**dict(comp), "props": dict(comp.props)})
+        for comp in sketch
+    )
+
 
 def create_sample_sketch() -> list[PlacedComponent]:
     """Create a sample sketch with multiple components"""
     return [
-        PlacedComponent(
+        PlacedComponent.model_construct(
             id="component-1",
             type=ComponentType.INPUT,
             x=100,
             y=50,
             width=300,
             height=40,
-            props={},
+            props=_EMPTY_PROPS,
         ),
-        PlacedComponent(
+        PlacedComponent.model_construct(
             id="component-2",
             type=ComponentType.BUTTON,
             x=420,
             y=50,
             width=100,
             height=40,
-            props={},
+            props=_EMPTY_PROPS,
         ),
-        PlacedComponent(
+        PlacedComponent.model_construct(
             id="component-3",
             type=ComponentType.IMAGE_PLACEHOLDER,
             x=100,
             y=110,
             width=420,
             height=200,
-            props={},
+            props=_EMPTY_PROPS,
         ),
     ]
 
@@ -44,14 +71,14 @@ def create_empty_sketch() -> list[PlacedComponent]:
 def create_single_component_sketch() -> list[PlacedComponent]:
     """Create a sketch with a single component"""
     return [
-        PlacedComponent(
+        PlacedComponent.model_construct(
             id="component-1",
             type=ComponentType.CONTAINER,
             x=100,
             y=100,
             width=200,
             height=200,
-            props={},
+            props=_EMPTY_PROPS,
         ),
     ]
 
@@ -61,14 +88,14 @@ def create_large_sketch() -> list[PlacedComponent]:
     components = []
     for i in range(20):
         components.append(
-            PlacedComponent(
+            PlacedComponent.model_construct(
                 id=f"component-{i}",
                 type=ComponentType.CONTAINER,
                 x=100 + (i % 5) * 150,
                 y=100 + (i // 5) * 150,
                 width=120,
                 height=120,
-                props={},
+                props=_EMPTY_PROPS,
             )
         )
     return components
@@ -1,11 +1,24 @@
 """Test helper utilities"""
 
 import json
+from contextlib import aclosing
 from typing import Any, Optional
 from app.agent.state import AgentState
 from app.schemas.sketch import PlacedComponent
 
 
+# Defaults shared by every test state; merged into a new dict per call
+_DEFAULT_STATE: dict[str, Any] = {
+    "message_history": None,
+    "layout_analysis": None,
+    "operations": None,
+    "modification": None,
+    "modified_sketch": None,
+    "error": None,
+    "retry_count": 0,
+}
+
+
 def create_agent_state(
     session_id: str = "test-session",
     user_message: str = "Test message",
@@ -13,47 +26,97 @@ def create_agent_state(
     step: str = "analyze",
     **kwargs,
 ) -> AgentState:
-    """Create a test agent state"""
-    if current_sketch is None and "current_sketch" not in kwargs:
+    """Create a test agent state
+
+    initial_sketch and latest_sketch alias current_sketch; nodes replace these
+    lists rather than mutating them.
+    """
+    if current_sketch is None:
         from tests.fixtures import create_sample_sketch
 
         current_sketch = create_sample_sketch()
 
-    # Allow explicit None to be passed through
-    if "current_sketch" in kwargs:
-        current_sketch = kwargs.pop("current_sketch")
-
-    state: AgentState = {
+    return _DEFAULT_STATE | {
         "session_id": session_id,
         "user_message": user_message,
-        "current_sketch": current_sketch,  # type: ignore
-        "message_history": None,
-        "layout_analysis": None,
-        "operations": None,
-        "modification": None,
-        "modified_sketch": None,
+        "current_sketch": current_sketch,
         "step": step,
-        "error": None,
-        "initial_sketch": current_sketch.copy() if current_sketch else [],  # type: ignore
-        "latest_sketch": current_sketch.copy() if current_sketch else [],  # type: ignore
-        "retry_count": 0,
-        **kwargs,
-    }
-    return state
+        "initial_sketch": current_sketch,
+        "latest_sketch": current_sketch,
+    } | kwargs  # type: ignore
+
+
+def by_id(sketch: list[PlacedComponent]) -> dict[str, PlacedComponent]:
+    """Index sketch components by id"""
+    return {comp.id: comp for comp in sketch}
+
+
+class StubLLM:
+    """Stand-in for LLMService whose invoke returns ret or raises exc
+
+    A plain coroutine is much cheaper per call than AsyncMock; reassign ret/exc to
+    change the reply.
+    """
+
+    __slots__ = ("ret", "exc")
+
+    def __init__(self, ret: Optional[str] = None, exc: Optional[BaseException] = None):
+        self.ret = ret
+        self.exc = exc
+
+    async def invoke(self, *args, **kwargs) -> Optional[str]:
+        if self.exc is not None:
+            raise self.exc
+        return self.ret
+
+
+async def run_graph_to_end(graph, initial_state: AgentState, config: dict) -> Optional[dict]:
+    """Stream a graph run and return the last node state
+
+    Stops as soon as a node reports a terminal step ("complete" or "error").
+    """
+    final_state = None
+    async with aclosing(graph.astream(initial_state, config)) as stream:
+        async for update in stream:
+            # Updates are {node_name: node_state} with a single node per event
+            try:
+                final_state = next(iter(update.values()))
+            except (AttributeError, StopIteration):
+                final_state = update
+            if final_state and final_state.get("step") in ("complete", "error"):
+                return final_state
+    return final_state
 
 
 def assert_state_step(state: AgentState, expected_step: str) -> None:
     """Assert that state step matches expected value"""
-    assert state["step"] == expected_step, f"Expected step '{expected_step}', got '{state['step']}'"
+    step = state["step"]
+    assert step == expected_step, f"Expected step {expected_step!r}, got {step!r}"
 
 
 def assert_state_error(state: AgentState, should_have_error: bool = True) -> None:
     """Assert error state"""
+    error = state["error"]
     if should_have_error:
-        assert state["error"] is not None, "Expected error but state.error is None"
-        assert state["step"] == "error", f"Expected step 'error', got '{state['step']}'"
+        step = state["step"]
+        assert error is not None, "Expected error but state.error is None"
+        assert step == "error", f"Expected step 'error', got {step!r}"
+    else:
+        assert error is None, f"Unexpected error: {error}"
+
+
+def assert_state(state: AgentState, step: str, error: bool = False, **extra: Any) -> None:
+    """Assert step, error presence and any extra state fields in one call"""
+    actual_step = state["step"]
+    actual_error = state["error"]
+    assert actual_step == step, f"Expected step {step!r}, got {actual_step!r}"
+    if error:
+        assert actual_error is not None, "Expected error but state.error is None"
     else:
-        assert state["error"] is None, f"Unexpected error: {state['error']}"
+        assert actual_error is None, f"Unexpected error: {actual_error}"
+    for key, expected in extra.items():
+        actual = state[key]
+        assert actual == expected, f"Expected {key}={expected!r}, got {actual!r}"
 
 
 def assert_sketch_valid(sketch: list[PlacedComponent]) -> None:
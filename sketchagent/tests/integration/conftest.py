@@ -0,0 +1,24 @@
+"""Integration test fixtures"""
+
+import orjson
+import pytest
+from pathlib import Path
+from app.schemas.sketch import PlacedComponent
+
+# Needs a real OpenAI API key; run it directly with python instead
+collect_ignore = ["test_real_sketch_manual.py"]
+
+
+@pytest.fixture(scope="session")
+def websketch1_raw() -> list[dict]:
+    """Parsed websketch1.json component data, loaded once per session"""
+    json_file = Path(__file__).parent.parent.parent / "data" / "websketch1.json"
+
+    with open(json_file, "rb") as f:
+        return orjson.loads(f.read())
+
+
+@pytest.fixture(scope="session")
+def websketch1_components(websketch1_raw) -> tuple[PlacedComponent, ...]:
+    """websketch1.json components validated as PlacedComponent once per session"""
+    return tuple(PlacedComponent(**comp) for comp in websketch1_raw)
@@ -1,21 +1,11 @@
 """Integration tests for API endpoints"""
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, MagicMock
-from app.main import app
-from app.api.routes import set_services
+from unittest.mock import MagicMock
 from app.services.llm_service import LLMService
 from app.services.redis_service import RedisService
 
 
-@pytest.fixture
-def test_client(mock_llm_service, mock_redis_service):
-    """Create test client with mocked services"""
-    set_services(mock_redis_service, mock_llm_service)
-    return TestClient(app)
-
-
 @pytest.mark.integration
 class TestAPIEndpoints:
     """Test API endpoints"""
@@ -27,11 +17,11 @@ class TestAPIEndpoints:
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_create_session(self, test_client, sample_sketch):
+    def test_create_session(self, test_client, sample_sketch_dump):
         """Test session creation"""
         response = test_client.post(
             "/api/v1/session",
-            json=[comp.model_dump() for comp in sample_sketch],
+            json=sample_sketch_dump,
             headers={"X-API-Key": "test-key"},
         )
         assert response.status_code == 200
@@ -55,17 +45,15 @@ class TestAPIEndpoints:
         assert data["sessionId"] == session_id
         assert "currentSketch" in data
 
-    def test_chat_endpoint(self, test_client, sample_sketch, mock_llm_service):
+    def test_chat_endpoint(self, test_client, sample_sketch_dump, mock_llm_service):
         """Test chat endpoint"""
-        mock_llm_service.invoke = AsyncMock(
-            return_value='{"operations": [{"type": "move", "componentId": "component-1", "x": 200, "y": 150}], "reasoning": "Test", "description": "Test"}'
-        )
+        mock_llm_service.ret = '{"operations": [{"type": "move", "componentId": "component-1", "x": 200, "y": 150}], "reasoning": "Test", "description": "Test"}'
 
         response = test_client.post(
             "/api/v1/chat",
             json={
                 "message": "Move component",
-                "currentSketch": [comp.model_dump() for comp in sample_sketch],
+                "currentSketch": sample_sketch_dump,
             },
             headers={"X-API-Key": "test-key"},
         )
@@ -75,15 +63,15 @@ class TestAPIEndpoints:
         assert "modifiedSketch" in data
         assert "operations" in data
 
-    def test_chat_endpoint_error_handling(self, test_client, sample_sketch, mock_llm_service):
+    def test_chat_endpoint_error_handling(self, test_client, sample_sketch_dump, mock_llm_service):
         """Test chat endpoint error handling"""
-        mock_llm_service.invoke = AsyncMock(side_effect=Exception("LLM error"))
+        mock_llm_service.exc = Exception("LLM error")
 
         response = test_client.post(
             "/api/v1/chat",
             json={
                 "message": "Move component",
-                "currentSketch": [comp.model_dump() for comp in sample_sketch],
+                "currentSketch": sample_sketch_dump,
             },
             headers={"X-API-Key": "test-key"},
         )
@@ -1,21 +1,18 @@
 """Integration tests using real sketch data"""
 
-import json
 import pytest
-from pathlib import Path
-from unittest.mock import AsyncMock
 from app.agent.graph import create_agent_graph
+from app.agent.nodes.analyzer import analyze_node
 from app.agent.state import AgentState
 from app.services.llm_service import LLMService
+from tests.helpers import by_id
 
-
-def load_websketch1() -> list:
-    """Load the websketch1.json file"""
-    data_dir = Path(__file__).parent.parent.parent / "data"
-    json_file = data_dir / "websketch1.json"
-
-    with open(json_file, "r") as f:
-        return json.load(f)
+# Mock LLM reply for a single move; filled with str.format instead of json.dumps per test
+MOVE_RESPONSE_TEMPLATE = (
+    '{{"operations": [{{"type": "move", "componentId": "{cid}", "x": {x}, "y": {y}}}], '
+    '"reasoning": "Moving the input component 200 pixels to the right as requested", '
+    '"description": "Input component moved to the right"}}'
+)
 
 
 @pytest.mark.integration
@@ -23,10 +20,9 @@ class TestRealSketch:
     """Test agent with real sketch data from websketch1.json"""
 
     @pytest.mark.asyncio
-    async def test_move_input_to_right(self, mock_llm_service):
+    async def test_move_input_to_right(self, mock_llm_service, websketch1_raw, websketch1_components):
         """Test moving the input component to the right using real sketch data"""
-        # Load real sketch data
-        sketch_data = load_websketch1()
+        sketch_data = websketch1_raw
 
         # Find the input component
         input_component = None
@@ -42,24 +38,11 @@ class TestRealSketch:
         new_x = original_x + 200
 
         # Configure mock LLM to return a move operation
-        mock_llm_service.invoke = AsyncMock(
-            return_value=json.dumps({
-                "operations": [
-                    {
-                        "type": "move",
-                        "componentId": input_component["id"],
-                        "x": new_x,
-                        "y": input_component["y"]
-                    }
-                ],
-                "reasoning": "Moving the input component 200 pixels to the right as requested",
-                "description": "Input component moved to the right"
-            })
+        mock_llm_service.ret = MOVE_RESPONSE_TEMPLATE.format(
+            cid=input_component["id"], x=new_x, y=input_component["y"]
         )
 
-        # Convert sketch data to PlacedComponent objects
-        from app.schemas.sketch import PlacedComponent
-        current_sketch = [PlacedComponent(**comp) for comp in sketch_data]
+        current_sketch = list(websketch1_components)
 
         # Create agent graph
         graph = create_agent_graph(mock_llm_service)
@@ -76,23 +59,16 @@ class TestRealSketch:
             "modified_sketch": None,
             "step": "analyze",
             "error": None,
-            "initial_sketch": current_sketch.copy(),
-            "latest_sketch": current_sketch.copy(),
+            "initial_sketch": current_sketch,
+            "latest_sketch": current_sketch,
             "retry_count": 0,
         }
 
         config = {"configurable": {"thread_id": "test-websketch1"}}
 
         # Run graph
-        final_state = None
         try:
-            async for state_dict in graph.astream(initial_state, config):
-                if isinstance(state_dict, dict):
-                    for node_name, node_state in state_dict.items():
-                        if isinstance(node_state, dict):
-                            final_state = node_state
-                        else:
-                            final_state = state_dict
+            final_state = await graph.ainvoke(initial_state, config)
         except KeyError as e:
             pytest.fail(f"Graph routing error: {e}")
 
@@ -104,11 +80,8 @@ class TestRealSketch:
 
         # Verify the input component was moved
         modified_sketch = final_state["modified_sketch"]
-        moved_input = None
-        for comp in modified_sketch:
-            if comp.id == input_component["id"]:
-                moved_input = comp
-                break
+        modified_by_id = by_id(modified_sketch)
+        moved_input = modified_by_id.get(input_component["id"])
 
         assert moved_input is not None, "Input component not found in modified sketch"
         assert moved_input.x == new_x, f"Expected x={new_x}, got x={moved_input.x}"
@@ -116,20 +89,16 @@ class TestRealSketch:
 
         # Verify other components are unchanged
         original_ids = {comp["id"] for comp in sketch_data}
-        modified_ids = {comp.id for comp in modified_sketch}
-        assert original_ids == modified_ids, "Component IDs should match (no components added/removed)"
+        assert original_ids == modified_by_id.keys(), "Component IDs should match (no components added/removed)"
 
         # Verify component count is the same
         assert len(modified_sketch) == len(sketch_data), "Component count should remain the same"
 
     @pytest.mark.asyncio
-    async def test_analyze_real_sketch(self, mock_llm_service):
+    async def test_analyze_real_sketch(self, mock_llm_service, websketch1_raw, websketch1_components):
         """Test analyzing the real sketch layout"""
-        sketch_data = load_websketch1()
-        from app.schemas.sketch import PlacedComponent
-        from app.agent.nodes.analyzer import analyze_node
-
-        current_sketch = [PlacedComponent(**comp) for comp in sketch_data]
+        sketch_data = websketch1_raw
+        current_sketch = list(websketch1_components)
 
         state: AgentState = {
             "session_id": "test-analyze",
@@ -142,8 +111,8 @@ class TestRealSketch:
             "modified_sketch": None,
             "step": "analyze",
             "error": None,
-            "initial_sketch": current_sketch.copy(),
-            "latest_sketch": current_sketch.copy(),
+            "initial_sketch": current_sketch,
+            "latest_sketch": current_sketch,
             "retry_count": 0,
         }
 
@@ -1,15 +1,14 @@
 """Manual test script for testing agent with websketch1.json
 
-Run this script to test the agent with real sketch data:
-    python -m pytest tests/integration/test_real_sketch_manual.py -v -s
-
-Or run directly:
+pytest does not collect this file (see collect_ignore in conftest.py). It needs a
+real OpenAI API key; run it directly:
     python tests/integration/test_real_sketch_manual.py
 """
 
-import json
+import orjson
 import asyncio
 import sys
+from contextlib import aclosing
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -27,8 +26,8 @@ def load_websketch1() -> list:
     data_dir = Path(__file__).parent.parent.parent / "data"
     json_file = data_dir / "websketch1.json"
 
-    with open(json_file, "r") as f:
-        return json.load(f)
+    with open(json_file, "rb") as f:
+        return orjson.loads(f.read())
 
 
 async def test_move_input_to_right():
@@ -37,8 +36,22 @@ async def test_move_input_to_right():
     print("Testing Agent with websketch1.json - Move Input to Right")
     print("=" * 80)
 
+    # Read the sketch in a worker thread while the LLM client and graph are built;
+    # run_in_executor submits it now, whereas a to_thread task would wait for an await
+    sketch_task = asyncio.get_running_loop().run_in_executor(None, load_websketch1)
+
+    # Create LLM service (will use real API if OPENAI_API_KEY is set)
+    llm_service = LLMService(
+        api_key=settings.openai_api_key,
+        model_name=settings.openai_model,
+        temperature=settings.openai_temperature,
+    )
+
+    # Create agent graph
+    graph = create_agent_graph(llm_service)
+
     # Load real sketch data
-    sketch_data = load_websketch1()
+    sketch_data = await sketch_task
     print(f"\nLoaded sketch with {len(sketch_data)} components")
 
     # Find the input component
@@ -65,16 +78,6 @@ async def test_move_input_to_right():
     # Convert sketch data to PlacedComponent objects
     current_sketch = [PlacedComponent(**comp) for comp in sketch_data]
 
-    # Create LLM service (will use real API if OPENAI_API_KEY is set)
-    llm_service = LLMService(
-        api_key=settings.openai_api_key,
-        model_name=settings.openai_model,
-        temperature=settings.openai_temperature,
-    )
-
-    # Create agent graph
-    graph = create_agent_graph(llm_service)
-
     # Initialize state
     initial_state: AgentState = {
         "session_id": "test-websketch1-manual",
@@ -87,8 +90,8 @@ async def test_move_input_to_right():
         "modified_sketch": None,
         "step": "analyze",
         "error": None,
-        "initial_sketch": current_sketch.copy(),
-        "latest_sketch": current_sketch.copy(),
+        "initial_sketch": current_sketch,
+        "latest_sketch": current_sketch,
         "retry_count": 0,
     }
 
@@ -102,18 +105,22 @@ async def test_move_input_to_right():
     final_state = None
     node_count = 0
     try:
-        async for state_dict in graph.astream(initial_state, config):
-            if isinstance(state_dict, dict):
-                for node_name, node_state in state_dict.items():
-                    if isinstance(node_state, dict):
-                        final_state = node_state
-                        node_count += 1
-                        step = node_state.get("step", "unknown")
-                        print(f"\n[{node_count}] Node: {node_name} -> Step: {step}")
-                        if node_state.get("error"):
-                            print(f"  ERROR: {node_state.get('error')}")
-                        if node_state.get("operations"):
-                            print(f"  Operations: {len(node_state.get('operations', []))}")
+        async with aclosing(graph.astream(initial_state, config)) as stream:
+            async for state_dict in stream:
+                # Each update carries a single {node_name: node_state} entry
+                node_name, node_state = next(iter(state_dict.items()))
+                if not isinstance(node_state, dict):
+                    continue
+                final_state = node_state
+                node_count += 1
+                step = node_state.get("step", "unknown")
+                print(f"\n[{node_count}] Node: {node_name} -> Step: {step}")
+                if node_state.get("error"):
+                    print(f"  ERROR: {node_state.get('error')}")
+                if node_state.get("operations"):
+                    print(f"  Operations: {len(node_state.get('operations', []))}")
+                if step in ("complete", "error"):
+                    break
     except Exception as e:
         print(f"\nERROR during graph execution: {e}")
         import traceback
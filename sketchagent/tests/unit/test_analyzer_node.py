@@ -1,8 +1,8 @@
 """Tests for analyzer node"""
 
 import pytest
-from tests.fixtures import create_sample_sketch, create_empty_sketch
-from tests.helpers import create_agent_state, assert_state_step, assert_state_error
+from tests.fixtures import create_sample_sketch, create_empty_sketch, create_single_component_sketch
+from tests.helpers import create_agent_state, assert_state
 from app.agent.nodes.analyzer import analyze_node
 
 
@@ -19,8 +19,7 @@ class TestAnalyzerNode:
 
         result = analyze_node(state)
 
-        assert_state_step(result, "modify")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "modify")
         assert result["layout_analysis"] is not None
         assert "layoutStats" in result["layout_analysis"]
         assert result["layout_analysis"]["layoutStats"]["componentCount"] == len(sample_sketch)
@@ -34,15 +33,12 @@ class TestAnalyzerNode:
 
         result = analyze_node(state)
 
-        assert_state_step(result, "modify")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "modify")
         assert result["layout_analysis"] is not None
         assert result["layout_analysis"]["layoutStats"]["componentCount"] == 0
 
     def test_analyze_single_component(self):
         """Test analysis with single component"""
-        from tests.fixtures import create_single_component_sketch
-
         sketch = create_single_component_sketch()
         state = create_agent_state(
             current_sketch=sketch,
@@ -51,8 +47,7 @@ class TestAnalyzerNode:
 
         result = analyze_node(state)
 
-        assert_state_step(result, "modify")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "modify")
         assert result["layout_analysis"] is not None
         assert result["layout_analysis"]["layoutStats"]["componentCount"] == 1
 
@@ -8,7 +8,7 @@ from tests.fixtures import (
     create_add_operation,
     create_delete_operation,
 )
-from tests.helpers import create_agent_state, assert_state_step, assert_state_error, assert_sketch_valid
+from tests.helpers import create_agent_state, assert_state, assert_sketch_valid, by_id
 from app.agent.nodes.executor import execute_node
 
 
@@ -30,15 +30,12 @@ class TestExecutorNode:
 
         result = execute_node(state)
 
-        assert_state_step(result, "complete")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "complete")
         assert result["modified_sketch"] is not None
         assert len(result["modified_sketch"]) == len(sample_sketch)
 
         # Check that component was moved
-        moved_comp = next(
-            (c for c in result["modified_sketch"] if c.id == "component-1"), None
-        )
+        moved_comp = by_id(result["modified_sketch"]).get("component-1")
         assert moved_comp is not None
         assert moved_comp.x == 200
         assert moved_comp.y == 150
@@ -59,13 +56,10 @@ class TestExecutorNode:
 
         result = execute_node(state)
 
-        assert_state_step(result, "complete")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "complete")
 
         # Check that component was resized
-        resized_comp = next(
-            (c for c in result["modified_sketch"] if c.id == "component-1"), None
-        )
+        resized_comp = by_id(result["modified_sketch"]).get("component-1")
         assert resized_comp is not None
         assert resized_comp.width == 400
         assert resized_comp.height == 60
@@ -84,14 +78,12 @@ class TestExecutorNode:
 
         result = execute_node(state)
 
-        assert_state_step(result, "complete")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "complete")
         assert len(result["modified_sketch"]) == len(sample_sketch) + 1
 
         # Check that new component was added
-        new_components = [
-            c for c in result["modified_sketch"] if c.id not in [comp.id for comp in sample_sketch]
-        ]
+        original = by_id(sample_sketch)
+        new_components = [c for c in result["modified_sketch"] if c.id not in original]
         assert len(new_components) == 1
         assert new_components[0].type.value == "Button"
 
@@ -109,14 +101,11 @@ class TestExecutorNode:
 
         result = execute_node(state)
 
-        assert_state_step(result, "complete")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "complete")
         assert len(result["modified_sketch"]) == len(sample_sketch) - 1
 
         # Check that component was deleted
-        deleted_comp = next(
-            (c for c in result["modified_sketch"] if c.id == "component-1"), None
-        )
+        deleted_comp = by_id(result["modified_sketch"]).get("component-1")
         assert deleted_comp is None
 
     def test_execute_multiple_operations(self, sample_sketch):
@@ -134,8 +123,7 @@ class TestExecutorNode:
 
         result = execute_node(state)
 
-        assert_state_step(result, "complete")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, "complete")
         assert_sketch_valid(result["modified_sketch"])
 
     def test_execute_no_operations(self, sample_sketch):
@@ -148,8 +136,7 @@ class TestExecutorNode:
 
         result = execute_node(state)
 
-        assert_state_step(result, "error")
-        assert_state_error(result, should_have_error=True)
+        assert_state(result, "error", error=True)
         assert "No operations" in result["error"]
 
     def test_execute_preserves_other_components(self, sample_sketch):
@@ -167,15 +154,17 @@ class TestExecutorNode:
         result = execute_node(state)
 
         # Check that component-2 and component-3 are unchanged
-        comp2 = next((c for c in result["modified_sketch"] if c.id == "component-2"), None)
-        comp3 = next((c for c in result["modified_sketch"] if c.id == "component-3"), None)
+        modified = by_id(result["modified_sketch"])
+        comp2 = modified.get("component-2")
+        comp3 = modified.get("component-3")
 
         assert comp2 is not None
         assert comp3 is not None
 
         # Find original components
-        orig_comp2 = next((c for c in sample_sketch if c.id == "component-2"), None)
-        orig_comp3 = next((c for c in sample_sketch if c.id == "component-3"), None)
+        original = by_id(sample_sketch)
+        orig_comp2 = original.get("component-2")
+        orig_comp3 = original.get("component-3")
 
         assert orig_comp2 is not None
         assert orig_comp3 is not None
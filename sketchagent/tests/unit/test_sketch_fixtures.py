@@ -0,0 +1,43 @@
+"""Tests for sketch test fixtures"""
+
+import pytest
+from tests.fixtures import (
+    create_sample_sketch,
+    create_single_component_sketch,
+    create_large_sketch,
+    freeze_sketch,
+)
+from pydantic import ValidationError
+from app.schemas.sketch import PlacedComponent
+
+
+@pytest.mark.unit
+class TestSketchFixtures:
+    """Check that unvalidated fixture sketches match the schema"""
+
+    @pytest.mark.parametrize(
+        "factory",
+        [create_sample_sketch, create_single_component_sketch, create_large_sketch],
+    )
+    def test_fixture_sketch_validates(self, factory):
+        """Test that fixture components survive full validation unchanged"""
+        for comp in factory():
+            validated = PlacedComponent.model_validate(comp.model_dump())
+            assert validated.model_dump() == comp.model_dump()
+
+    def test_frozen_sketch_rejects_assignment(self):
+        """Test that frozen fixture components raise on mutation"""
+        sketch = freeze_sketch(create_sample_sketch())
+
+        assert all(isinstance(comp, PlacedComponent) for comp in sketch)
+        with pytest.raises(ValidationError):
+            sketch[0].x = 0
+
+    def test_frozen_sketch_props_are_not_shared(self):
+        """Test that frozen components do not share props with other fixture components"""
+        sketch = freeze_sketch(create_sample_sketch())
+
+        sketch[0].props["leak"] = True
+
+        assert "leak" not in sketch[1].props
+        assert all("leak" not in comp.props for comp in create_sample_sketch())
@@ -0,0 +1,95 @@
+"""Tests for sketch parser"""
+
+import random
+import pytest
+from itertools import combinations
+from app.schemas.sketch import PlacedComponent, ComponentType
+from app.tools import sketch_parser
+from app.tools.sketch_parser import _identify_relationships, _SPATIAL_INDEX_MIN_COMPONENTS
+
+
+def _component(i: int, x: float, y: float, width: float, height: float) -> PlacedComponent:
+    return PlacedComponent.model_construct(
+        id=f"component-{i}",
+        type=ComponentType.CONTAINER,
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        props={},
+    )
+
+
+def _edge_case_sketch() -> list[PlacedComponent]:
+    """Sketch whose grid cell is 100px, with pairs on cell and alignment bucket boundaries"""
+    boxes = [
+        # Row of touching edges, each right edge on a cell boundary
+        *((x, 0, 100, 40) for x in range(0, 800, 100)),
+        # Same column, far apart vertically
+        (0, 2000, 100, 40),
+        (5, 4000, 100, 40),
+        # Same row, far apart horizontally
+        (3000, 0, 100, 40),
+        # Touching corner across a cell boundary
+        (800, 40, 100, 40),
+        # Left edges either side of an alignment bucket boundary
+        (19.9, 600, 100, 40),
+        (20.1, 800, 100, 40),
+        (39.9, 1000, 100, 40),
+        (60.0, 1200, 100, 40),
+        # Narrow components aligned across a cell and bucket boundary, sharing no column
+        (95, 1400, 4, 40),
+        (101, 1600, 4, 40),
+        # Barely separated and barely overlapping a cell edge
+        (199.5, 300, 0.5, 40),
+        (200.0, 300, 100, 40),
+        (299.9, 340, 100, 40),
+        # Wide and tall components spanning several cells
+        (0, 500, 900, 40),
+        (1000, 0, 40, 900),
+        (1100, 900, 100, 100),
+    ]
+    # Column of stacked components, touching vertically
+    boxes.extend((1500, y, 100, 40) for y in range(0, 600, 40))
+    return [_component(i, *box) for i, box in enumerate(boxes)]
+
+
+def _random_sketch(seed: int, n: int = 80) -> list[PlacedComponent]:
+    rng = random.Random(seed)
+    return [
+        _component(
+            i,
+            rng.choice([rng.randrange(0, 1200, 20), rng.uniform(0, 1200)]),
+            rng.choice([rng.randrange(0, 1200, 20), rng.uniform(0, 1200)]),
+            rng.choice([4, 20, 40, 100, rng.uniform(2, 300)]),
+            rng.choice([2, 40, 100, rng.uniform(2, 300)]),
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.unit
+class TestIdentifyRelationships:
+    """Test the spatial index used for larger sketches"""
+
+    @pytest.mark.parametrize(
+        "components",
+        [
+            pytest.param(_edge_case_sketch(), id="edge_cases"),
+            *(pytest.param(_random_sketch(seed), id=f"random-{seed}") for seed in range(5)),
+        ],
+    )
+    def test_spatial_index_matches_all_pairs(self, monkeypatch, components):
+        """Test that the spatial index finds the same relationships as checking every pair"""
+        assert len(components) >= _SPATIAL_INDEX_MIN_COMPONENTS
+
+        indexed = _identify_relationships(components)
+
+        monkeypatch.setattr(
+            sketch_parser,
+            "_candidate_pairs",
+            lambda comps, threshold: list(combinations(range(len(comps)), 2)),
+        )
+        brute_force = _identify_relationships(components)
+
+        assert indexed == brute_force
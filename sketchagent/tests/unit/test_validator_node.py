@@ -1,6 +1,8 @@
 """Tests for validator node"""
 
+import re
 import pytest
+from functools import partial
 from tests.fixtures import (
     create_sample_sketch,
     create_move_operation,
@@ -8,171 +10,87 @@ from tests.fixtures import (
     create_add_operation,
     create_invalid_operation,
 )
-from tests.helpers import create_agent_state, assert_state_step, assert_state_error
+from tests.helpers import create_agent_state, assert_state
 from app.agent.nodes.validator import validate_node
 
-
-@pytest.mark.unit
-class TestValidatorNode:
-    """Test validator node functionality"""
-
-    def test_validate_success(self, sample_sketch):
-        """Test successful validation"""
-        operations = [
-            create_move_operation("component-1", 200, 100),
-        ]
-
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=operations,
-        )
-
-        result = validate_node(state)
-
-        assert_state_step(result, "execute")
-        assert_state_error(result, should_have_error=False)
-
-    def test_validate_multiple_operations(self, sample_sketch):
-        """Test validation with multiple operations"""
-        operations = [
+pytestmark = pytest.mark.unit
+
+_make_state = partial(create_agent_state, step="validate")
+
+# Error message patterns, compiled once for the whole module
+_NO_OPS_RE = re.compile(r"No operations")
+_NOT_FOUND_RE = re.compile(r"not found", re.IGNORECASE)
+_CURR_SKETCH_RE = re.compile(r"current sketch", re.IGNORECASE)
+
+# State with explicit None for current_sketch; tests copy it and set operations
+_BASE_NO_SKETCH_STATE: dict = {
+    "session_id": "test-session",
+    "user_message": "Test",
+    "current_sketch": None,
+    "message_history": None,
+    "layout_analysis": None,
+    "operations": None,
+    "modification": None,
+    "modified_sketch": None,
+    "step": "validate",
+    "error": None,
+    "initial_sketch": [],
+    "latest_sketch": [],
+    "retry_count": 0,
+}
+
+# (name, ops_factory, step, err_re): factories run inside the test so collection
+# stays cheap; err_re is a pattern the error message must match, or None
+CASES = [
+    ("move_ok", lambda: [create_move_operation("component-1", 200, 100)], "execute", None),
+    (
+        "multiple_ok",
+        lambda: [
             create_move_operation("component-1", 200, 100),
             create_resize_operation("component-2", 150, 50),
-        ]
+        ],
+        "execute",
+        None,
+    ),
+    ("no_ops", lambda: None, "error", _NO_OPS_RE),
+    ("empty_ops", lambda: [], "error", None),
+    ("missing_component_id", lambda: [create_move_operation(None, 200, 100)], "error", None),  # type: ignore
+    (
+        "nonexistent_component",
+        lambda: [create_move_operation("nonexistent-id", 200, 100)],
+        "error",
+        _NOT_FOUND_RE,
+    ),
+    ("resize_too_small", lambda: [create_resize_operation("component-1", 10, 10)], "error", None),
+    ("add_ok", lambda: [create_add_operation("Button", 500, 500, 100, 50)], "execute", None),
+]
 
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=operations,
-        )
-
-        result = validate_node(state)
-
-        assert_state_step(result, "execute")
-        assert_state_error(result, should_have_error=False)
-
-    def test_validate_no_operations(self, sample_sketch):
-        """Test validation with no operations"""
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=None,
-        )
-
-        result = validate_node(state)
-
-        assert_state_step(result, "error")
-        assert_state_error(result, should_have_error=True)
-        assert "No operations" in result["error"]
-
-    def test_validate_empty_operations_list(self, sample_sketch):
-        """Test validation with empty operations list"""
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=[],
-        )
-
-        result = validate_node(state)
 
-        assert_state_step(result, "error")
-        assert_state_error(result, should_have_error=True)
-
-    def test_validate_missing_component_id(self, sample_sketch):
-        """Test validation with missing component ID"""
-        operations = [
-            create_move_operation(None, 200, 100),  # type: ignore
-        ]
-
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=operations,
-        )
-
-        result = validate_node(state)
-
-        assert_state_step(result, "error")
-        assert_state_error(result, should_have_error=True)
-
-    def test_validate_nonexistent_component(self, sample_sketch):
-        """Test validation with non-existent component ID"""
-        operations = [
-            create_move_operation("nonexistent-id", 200, 100),
-        ]
-
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=operations,
-        )
-
-        result = validate_node(state)
-
-        assert_state_step(result, "error")
-        assert_state_error(result, should_have_error=True)
-        assert "not found" in result["error"].lower()
-
-    def test_validate_invalid_resize(self, sample_sketch):
-        """Test validation with invalid resize (too small)"""
-        operations = [
-            create_resize_operation("component-1", 10, 10),  # Too small
-        ]
-
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=operations,
-        )
-
-        result = validate_node(state)
-
-        assert_state_step(result, "error")
-        assert_state_error(result, should_have_error=True)
-
-    def test_validate_add_operation(self, sample_sketch):
-        """Test validation of add operation"""
-        operations = [
-            create_add_operation("Button", 500, 500, 100, 50),
-        ]
+class TestValidatorNode:
+    """Test validator node functionality"""
 
-        state = create_agent_state(
-            current_sketch=sample_sketch,
-            step="validate",
-            operations=operations,
-        )
+    @pytest.mark.parametrize(
+        "ops_factory,step,err_re",
+        [pytest.param(*case[1:], id=case[0]) for case in CASES],
+    )
+    def test_validate(self, sample_sketch, ops_factory, step, err_re):
+        """Test validation step, error presence and error message for each operations case"""
+        state = _make_state(current_sketch=sample_sketch, operations=ops_factory())
 
         result = validate_node(state)
 
-        assert_state_step(result, "execute")
-        assert_state_error(result, should_have_error=False)
+        assert_state(result, step, error=step == "error")
+        if err_re is not None:
+            assert err_re.search(result["error"]), f"{err_re.pattern!r} not in {result['error']!r}"
 
     def test_validate_no_current_sketch(self):
         """Test validation when current_sketch is None"""
-        from tests.fixtures import create_move_operation
-
         operations = [create_move_operation("component-1", 200, 100)]
 
-        # Create state with explicit None for current_sketch
-        state: dict = {
-            "session_id": "test-session",
-            "user_message": "Test",
-            "current_sketch": None,  # type: ignore
-            "message_history": None,
-            "layout_analysis": None,
-            "operations": operations,
-            "modification": None,
-            "modified_sketch": None,
-            "step": "validate",
-            "error": None,
-            "initial_sketch": [],
-            "latest_sketch": [],
-            "retry_count": 0,
-        }
+        state: dict = {**_BASE_NO_SKETCH_STATE, "operations": operations}
 
         result = validate_node(state)
 
-        assert_state_step(result, "error")
-        assert_state_error(result, should_have_error=True)
-        assert "current sketch" in result["error"].lower()
+        assert_state(result, "error", error=True)
+        assert _CURR_SKETCH_RE.search(result["error"])
 